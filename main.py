@@ -4,31 +4,42 @@ from pathlib import Path
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from operator import attrgetter
+import functools
+import hashlib
 import json
+import mmap
+import os
+import re
+import sys
 from enum import Enum, auto
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import cv2
-from skimage.metrics import structural_similarity as ssim
 import numpy as np
 import pandas as pd
 
-@dataclass
+@dataclass(slots=True)
 class RenderElement:
     frame : int = 0
     name: str = ""
     delta_count: int = 0
     status: str = ""
     exit_code: int = 0
-    ref_file: Path = None
-    ref_repro_file: Path = None
-    run_file: Path = None
-    delta_file: Path = None
-
-@dataclass
-class TestDiff:
-    render_elements: list[RenderElement] = field(default_factory=list) 
-
-@dataclass
+    # kept as raw strings: constructing four Path objects per element is
+    # measurable at load time and most elements are never opened
+    ref_file: str = ""
+    ref_repro_file: str = ""
+    run_file: str = ""
+    delta_file: str = ""
+
+@dataclass(slots=True)
 class TestResult:
     end_time: datetime = 0.0
     start_time: datetime = 0.0
@@ -40,9 +51,21 @@ class TestResult:
     status: str = ""
     stats: dict = field(default_factory=dict)
     worker_index: int = 0
-    diff: dict = field(default_factory=dict) # dict of TestDiff objects mapping the name of the render element to the list of frames generated for this type of output
+    raw_diff: list = field(default_factory=list) # raw "diff" JSON items, converted to render elements on first access
+    _diff: dict = field(default=None, repr=False)
+
+    @property
+    def diff(self) -> dict:
+        """Render elements grouped by name, parsed lazily on first access.
+
+        Most tests are never clicked, so the per-frame RenderElement
+        objects are only built once something actually needs them.
+        """
+        if self._diff is None:
+            self._diff = load_test_diff(self.raw_diff)
+        return self._diff
 
-@dataclass
+@dataclass(slots=True)
 class TestHeader:
     total_tests: int = 0
     failed_tests: int = 0
@@ -59,78 +82,89 @@ class TestHeader:
     duration: timedelta = field(default_factory=timedelta)
 
 def load_render_element(json_data, frame)-> RenderElement:
-    render_element = RenderElement()
-    render_element.frame = frame
-    render_element.name = json_data.get("name", "")
-    render_element.delta_count = json_data.get("deltaCount", 0)
-    render_element.status = json_data.get("status", "")
-    render_element.exit_code = json_data.get("exitCode", 0)
-    render_element.ref_file = Path(json_data.get("refFile", ""))
-    render_element.ref_repro_file = Path(json_data.get("refReproFile", ""))
-    render_element.run_file = Path(json_data.get("runFile", ""))
-    render_element.delta_file = Path(json_data.get("deltaFile", ""))
-    return render_element
+    # bind the bound method once and construct in a single call instead of
+    # nine per-field attribute assignments; this loader runs once per
+    # (frame, render element) and adds up on large result sets
+    get = json_data.get
+    # name and status repeat across thousands of elements; interning them
+    # keeps one shared str per distinct value and makes the grouping dict
+    # lookups pointer comparisons
+    return RenderElement(
+        frame=frame,
+        name=sys.intern(get("name", "")),
+        delta_count=get("deltaCount", 0),
+        status=sys.intern(get("status", "")),
+        exit_code=get("exitCode", 0),
+        ref_file=get("refFile", ""),
+        ref_repro_file=get("refReproFile", ""),
+        run_file=get("runFile", ""),
+        delta_file=get("deltaFile", ""),
+    )
+
+# C-level sort key, noticeably cheaper than a lambda per comparison
+_FRAME_KEY = attrgetter("frame")
 
 def load_test_diff(json_data) -> dict:
-    diffs = []
-
+    # group render elements by name in a single pass over the raw diff items
+    render_elements = defaultdict(list)
     for diff_item in json_data:
-        diff = TestDiff()
         frame = diff_item.get("frame", 0)
-        diff.render_elements = [load_render_element(element, frame) for element in diff_item.get("renderElements", [])]
-        diffs.append(diff)
-
-    # create unique render elements by name
-    render_elements = {}
-    for diff in diffs:
-        for element in diff.render_elements:
-            if element.name not in render_elements:
-                render_elements[element.name] = []
-            render_elements[element.name].append(element)
-
-    # sort render_elements by frame number
+        for element in diff_item.get("renderElements", []):
+            render_element = load_render_element(element, frame)
+            render_elements[render_element.name].append(render_element)
+
+    # sort render_elements by frame number; input order isn't guaranteed
     for name, elements in render_elements.items():
-        elements.sort(key=lambda x: x.frame)
+        elements.sort(key=_FRAME_KEY)
+
+    return dict(render_elements)
+
 
-    return render_elements
+# bound once; skips the class attribute lookup on every test
+_fromtimestamp = datetime.fromtimestamp
 
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 def load_test_result(json_data) -> TestResult:
-    result = TestResult()
-    result.end_time = datetime.fromtimestamp(json_data.get("endTime", 0.0))
-    result.start_time = datetime.fromtimestamp(json_data.get("startTime", 0.0))
-    result.exit_code = json_data.get("exitCode", 0)
-    result.file_name = json_data.get("fileName", "")
-    result.file_path = Path(json_data.get("file", ""))
-    result.log_file = Path(json_data.get("logFile", ""))
-    result.metric = json_data.get("metric", "")
-    result.status = json_data.get("status", "")
-    result.stats = json_data.get("stats", {})
-    result.worker_index = json_data.get("workerIndex", 0)
-    # result.diff = [load_test_diff(diff_item) for diff_item in json_data.get("diff", [])]
-    result.diff = load_test_diff(json_data.get("diff", []))
-
-    return result
+    get = json_data.get
+    return TestResult(
+        end_time=_fromtimestamp(get("endTime", 0.0)),
+        start_time=_fromtimestamp(get("startTime", 0.0)),
+        exit_code=get("exitCode", 0),
+        file_name=get("fileName", ""),
+        file_path=Path(get("file", "")),
+        log_file=Path(get("logFile", "")),
+        metric=sys.intern(get("metric", "")),
+        status=sys.intern(get("status", "")),
+        stats=get("stats", {}),
+        worker_index=get("workerIndex", 0),
+        raw_diff=get("diff", []),
+    )
     
+# "H:M:S" duration as written by the test runner
+_DURATION_RE = re.compile(r"(\d+):(\d+):(\d+)")
+
 def load_test_header(json_data) -> TestHeader:
-    test_header = TestHeader()
-    test_header.total_tests = json_data.get("allTestsCount", 0)
-    test_header.failed_tests = json_data.get("failedTestsCount", 0)
-    test_header.labels = json_data.get("labels", [])
-    test_header.result_version = json_data.get("resultVersion", "3.0")
-    test_header.stats_fields = json_data.get("statsFields", {
-        "frameTime": { "label": "Frame Time", "dimension": "s"},
-        "fullFrameTime": { "label": "Full Frame Time", "dimension": "s"},
-        "totalTime": { "label": "Total Time", "dimension": "s"},
-    })
-    test_header.title = json_data.get("title", "Results")
-    test_header.update_ref_times = json_data.get("updateRefTimes", False)
-    test_header.version = json_data.get("version", {})
-    # duration conversion
-    duration_str = test_header.version.get("duration", "0:0:0")
-    hours, minutes, seconds = map(int, duration_str.split(":"))
-    test_header.duration = timedelta(hours=hours, minutes=minutes, seconds=seconds)
-    return test_header
+    get = json_data.get
+    version = get("version", {})
+    # duration conversion; a malformed string counts as zero instead of raising
+    match = _DURATION_RE.fullmatch(version.get("duration", "0:0:0"))
+    hours, minutes, seconds = (int(match[1]), int(match[2]), int(match[3])) if match else (0, 0, 0)
+    return TestHeader(
+        total_tests=get("allTestsCount", 0),
+        failed_tests=get("failedTestsCount", 0),
+        labels=get("labels", []),
+        result_version=get("resultVersion", "3.0"),
+        stats_fields=get("statsFields", {
+            "frameTime": { "label": "Frame Time", "dimension": "s"},
+            "fullFrameTime": { "label": "Full Frame Time", "dimension": "s"},
+            "totalTime": { "label": "Total Time", "dimension": "s"},
+        }),
+        title=get("title", "Results"),
+        update_ref_times=get("updateRefTimes", False),
+        version=version,
+        duration=timedelta(hours=hours, minutes=minutes, seconds=seconds),
+    )
 
 
 def open_directory_dialog(default_folder: Path=None) -> Path:
@@ -151,41 +185,206 @@ class TreeItemType(Enum):
     TestResult = auto()
     RenderElement = auto()
 
+# row highlight brushes shared by all items (QBrush is copy-on-write,
+# so one instance per colour is enough)
+_BRUSH_RED = QtGui.QBrush(QtGui.QColor(255, 0, 0, 100))
+_BRUSH_ORANGE = QtGui.QBrush(QtGui.QColor(255, 165, 0, 100))
+_BRUSH_GREEN = QtGui.QBrush(QtGui.QColor(0, 255, 0, 100))
+
 def set_table_model(view, model):
     view.setModel(model)
     header = view.horizontalHeader()
     header.setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeMode.Stretch)
 
-def create_render_elements_table_model(data : RenderElement):
-        model = QtGui.QStandardItemModel()
+def _update_field_value_model(model, rows):
+    # when the row layout already matches, only the value column changes;
+    # stepping through frames then updates text in place instead of
+    # allocating a fresh model plus two items per row. Signals are held
+    # back during the update so the view repaints once per frame instead
+    # of once per cell
+    model.blockSignals(True)
+    try:
+        if model.rowCount() == len(rows):
+            for row, (field_name, value) in enumerate(rows):
+                model.item(row, 1).setText(value)
+            return model
+        model.clear()
         model.setHorizontalHeaderLabels(["Field", "Value"])
-        model.appendRow([QtGui.QStandardItem("Name"), QtGui.QStandardItem(data.name)])
-        model.appendRow([QtGui.QStandardItem("Frame"), QtGui.QStandardItem(str(data.frame))])
-        model.appendRow([QtGui.QStandardItem("Delta Count"), QtGui.QStandardItem(str(data.delta_count))])
-        model.appendRow([QtGui.QStandardItem("Delta File"), QtGui.QStandardItem(str(data.delta_file))])
-        model.appendRow([QtGui.QStandardItem("Status"), QtGui.QStandardItem(data.status)])
-        model.appendRow([QtGui.QStandardItem("Exit Code"), QtGui.QStandardItem(str(data.exit_code))])        
+        for field_name, value in rows:
+            model.appendRow([QtGui.QStandardItem(field_name), QtGui.QStandardItem(value)])
         return model
+    finally:
+        model.blockSignals(False)
+        model.layoutChanged.emit()
+
+def create_render_elements_table_model(data : RenderElement, model: QtGui.QStandardItemModel=None):
+        if model is None:
+            model = QtGui.QStandardItemModel()
+        return _update_field_value_model(model, [
+            ("Name", data.name),
+            ("Frame", str(data.frame)),
+            ("Delta Count", str(data.delta_count)),
+            ("Delta File", str(data.delta_file)),
+            ("Status", data.status),
+            ("Exit Code", str(data.exit_code)),
+        ])
+
+def create_test_result_teable_model(data: TestResult, model: QtGui.QStandardItemModel=None):
+        if model is None:
+            model = QtGui.QStandardItemModel()
+        return _update_field_value_model(model, [
+            ("Name", data.file_name),
+            ("File Path", str(data.file_path)),
+            ("Log File", str(data.log_file)),
+            ("Exit Code", str(data.exit_code)),
+            ("Status", data.status),
+            ("Metric", data.metric),
+            ("Worker Index", str(data.worker_index)),
+            ("Start Time", data.start_time.strftime(_TIME_FORMAT)),
+            ("End Time", data.end_time.strftime(_TIME_FORMAT)),
+            ("Duration", str(data.end_time - data.start_time)),
+        ])
+
+def pixmap_cache_key(file, size):
+    return f"{file}:{size.width()}x{size.height()}"
+
+
+def read_image_scaled(file, size):
+    """Decode an image at the given display size.
+
+    Uses QImageReader.setScaledSize so the codec decodes straight at the
+    target size instead of materializing the full-resolution image and
+    rescaling it. Formats that can't report their size up front fall back
+    to decode-then-scale.
+    """
+    reader = QtGui.QImageReader(file)
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if source_size.isValid():
+        target_size = QtCore.QSize(source_size)
+        target_size.scale(size, QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+        reader.setScaledSize(target_size)
+        return reader.read()
+    image = reader.read()
+    if image.isNull():
+        return image
+    return image.scaled(size, QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                        QtCore.Qt.TransformationMode.SmoothTransformation)
+
+
+class ImageLoadSignals(QtCore.QObject):
+    # request_id, target label object name ("" for pure cache warming), cache key, image
+    loaded = QtCore.Signal(int, str, str, QtGui.QImage)
+
+
+class ImageLoadRunnable(QtCore.QRunnable):
+    """Decodes one image at the given size off the GUI thread.
+
+    QImage decoding is thread-safe (QPixmap is not), so the decoded image
+    is handed back through a signal and converted + cached on the GUI
+    thread.
+    """
+    def __init__(self, file, size, key, signals, request_id=0, label_name=""):
+        super().__init__()
+        self.file = file
+        self.size = size
+        self.key = key
+        self.signals = signals
+        self.request_id = request_id
+        self.label_name = label_name
+
+    def run(self):
+        # always emit, even for a failed decode: the GUI thread must blank
+        # the target label, otherwise it would keep showing the previous
+        # frame's pixmap for a file that is missing or unreadable
+        image = read_image_scaled(self.file, self.size)
+        self.signals.loaded.emit(self.request_id, self.label_name, self.key, image)
+
+
+def build_tree_model(test_results: list[TestResult]) -> QtGui.QStandardItemModel:
+    model = QtGui.QStandardItemModel()
+    model.setHorizontalHeaderLabels(["Results"])
+
+    directory_items = {}
+    # collect children per parent and append them in one call each, so the
+    # model emits one rowsInserted per parent instead of one per row
+    directory_children = {}
+
+    # items carry indices into test_results rather than the objects
+    # themselves, so the model doesn't keep a QVariant-wrapped copy of the
+    # whole dataclass graph alive
+    for test_index, test_result in enumerate(test_results):
+        # Create a new item for each test result
+        directory = test_result.file_path.parent
+        if directory not in directory_items:
+            directory_item = QtGui.QStandardItem(str(directory))
+            directory_items[directory] = directory_item
+            directory_children[directory] = []
+            directory_item.setData(TreeItemType.Directory.value, TreeUserRole.Type.value)
+            directory_item.setData(directory, TreeUserRole.Data.value)
+
+        test_item = QtGui.QStandardItem(test_result.file_name)
+        test_item.setToolTip(f"Status: {test_result.status}\nMetric: {test_result.metric}\nExit Code: {test_result.exit_code}")
+        test_item.setData(TreeItemType.TestResult.value, TreeUserRole.Type.value)
+        test_item.setData(test_index, TreeUserRole.Data.value)
+        # check the test_result exit code if it is not 0, set the background color to red
+        if test_result.exit_code != 0:
+            test_item.setBackground(_BRUSH_RED)
+
+        # group the raw diff entries by render element name; the per-frame
+        # RenderElement objects are only built when the node is clicked
+        element_names = {}
+        for diff_item in test_result.raw_diff:
+            for element in diff_item.get("renderElements", []):
+                element_names.setdefault(element.get("name", ""), []).append(element)
+
+        element_items = []
+        for name, raw_elements in element_names.items():
+            n_frames = len(raw_elements)
+            item_name = name if n_frames == 1 else f"{name} (x{n_frames})"
+            render_element = raw_elements[0]
+            render_element_item = QtGui.QStandardItem(item_name)
+            render_element_item.setToolTip(f"Delta Count: {render_element.get('deltaCount', 0)}\nStatus: {render_element.get('status', '')}")
+            render_element_item.setData(TreeItemType.RenderElement.value, TreeUserRole.Type.value)
+            render_element_item.setData((test_index, name), TreeUserRole.Data.value)
+            if render_element.get("exitCode", 0) != 0:
+                render_element_item.setBackground(_BRUSH_ORANGE)
+            else:
+                render_element_item.setBackground(_BRUSH_GREEN)
+            element_items.append(render_element_item)
 
-def create_test_result_teable_model(data: TestResult):
-        model = QtGui.QStandardItemModel()
-        model.setHorizontalHeaderLabels(["Field", "Value"])
-        model.appendRow([QtGui.QStandardItem("Name"), QtGui.QStandardItem(data.file_name)])
-        model.appendRow([QtGui.QStandardItem("File Path"), QtGui.QStandardItem(str(data.file_path))])
-        model.appendRow([QtGui.QStandardItem("Log File"), QtGui.QStandardItem(str(data.log_file))])
-        model.appendRow([QtGui.QStandardItem("Exit Code"), QtGui.QStandardItem(str(data.exit_code))])
-        model.appendRow([QtGui.QStandardItem("Status"), QtGui.QStandardItem(data.status)])
-        model.appendRow([QtGui.QStandardItem("Metric"), QtGui.QStandardItem(data.metric)])
-        model.appendRow([QtGui.QStandardItem("Worker Index"), QtGui.QStandardItem(str(data.worker_index))])
-        model.appendRow([QtGui.QStandardItem("Start Time"), QtGui.QStandardItem(data.start_time.strftime("%Y-%m-%d %H:%M:%S"))])
-        model.appendRow([QtGui.QStandardItem("End Time"), QtGui.QStandardItem(data.end_time.strftime("%Y-%m-%d %H:%M:%S"))])
-        model.appendRow([QtGui.QStandardItem("Duration"), QtGui.QStandardItem(str(data.end_time - data.start_time))])
-        return model
+        if element_items:
+            test_item.appendRows(element_items)
+        directory_children[directory].append(test_item)
+
+    for directory, children in directory_children.items():
+        directory_items[directory].appendRows(children)
+    model.invisibleRootItem().appendRows(list(directory_items.values()))
+    return model
+
+
+class TreeModelBuildSignals(QtCore.QObject):
+    finished = QtCore.Signal(QtGui.QStandardItemModel)
+
+
+class TreeModelBuildRunnable(QtCore.QRunnable):
+    """Builds the results tree model off the GUI thread.
+
+    QStandardItemModel construction is pure data work until the model is
+    attached to a view, so item creation for large result sets runs on the
+    pool. The finished model is pushed back to the GUI thread's event loop
+    before being handed over, as required for objects used from there.
+    """
+    def __init__(self, test_results, signals):
+        super().__init__()
+        self.test_results = test_results
+        self.signals = signals
+
+    def run(self):
+        model = build_tree_model(self.test_results)
+        model.moveToThread(QtGui.QGuiApplication.instance().thread())
+        self.signals.finished.emit(model)
 
-def create_pixmap_scaled(file, size):
-        if file:
-            return QtGui.QPixmap(str(file)).scaled(size, QtCore.Qt.AspectRatioMode.KeepAspectRatio, QtCore.Qt.TransformationMode.SmoothTransformation)
-        return None
 
 def setup_label_size_policy(label: QtWidgets.QLabel, size_policy: QtWidgets.QSizePolicy):
     label.setSizePolicy(size_policy)
@@ -201,24 +400,7 @@ class ProblemLevel(Enum):
     HARD = auto()
 
 
-@dataclass
-class ReportEntry:
-    directory: str = ""
-    test: str = ""
-    element: str = ""
-    mse: float = 0
-    SSIM: float = 0
-    diff_percentage: float = 0
-    diff_count_pre_computed: int = 0
-    diff_count: int = 0
-    pixel_count: int = 0
-    problem_level: ProblemLevel = ProblemLevel.HARD
-    level : int = 0 # 20 levels every 5% of the diff count
-    message: str = ""
-
-
-
-@dataclass
+@dataclass(slots=True)
 class Metrics:
     total_pixels_count: int = 0
     diff_pixels_count: int = 0
@@ -226,86 +408,222 @@ class Metrics:
     ssim: float = 0
 
 
-def ComputeMetrics(run_file : Path, ref_file : Path) -> Metrics | None:
-    # runfile and ref_file are Windows paths, check if it is a file and if it exists
-    ref_exists = ref_file.is_file() and ref_file.exists()
-    run_exists = run_file.is_file() and run_file.exists()
-    if not ref_exists or not run_exists:
+def ComputeMetrics(run_file : str, ref_file : str) -> Metrics | None:
+    # one stat per file: isfile already returns False for missing paths, so
+    # the extra exists() call was a second syscall for the same answer
+    if not (os.path.isfile(run_file) and os.path.isfile(ref_file)):
         print(f"Missing files: {run_file}, {ref_file}")
         return None
 
-    run_image = cv2.imread(str(run_file), cv2.IMREAD_GRAYSCALE)
-    ref_image = cv2.imread(str(ref_file), cv2.IMREAD_GRAYSCALE)
+    run_image = _load_gray(run_file)
+    ref_image = _load_gray(ref_file)
     if len(run_image) != len(run_image):
         print(f"Image sizes do not match: {run_image.shape}, {ref_image.shape}")
         return None
     diff_image = cv2.absdiff(run_image, ref_image)
 
     total_pixels = run_image.size
-    diff_pixels = np.count_nonzero(diff_image)
-    mse = np.mean((run_image - ref_image) ** 2)
-    ssim_value = ssim(run_image, ref_image)
+    diff_pixels = cv2.countNonZero(diff_image)
+    # NORM_L2SQR accumulates sum((run - ref)^2) in a wide type inside one
+    # fused OpenCV kernel: no squared temporary, no uint8 wraparound, one
+    # pass over the two images
+    mse = cv2.norm(run_image, ref_image, cv2.NORM_L2SQR) / total_pixels
+    # screening pass: SSIM on a 1/16-area pyramid is enough to call clear
+    # passes and clear failures; only ambiguous pairs pay for the
+    # full-resolution convolutions (absdiff/MSE above stay full-res, they
+    # are a single cheap pass)
+    ssim_value = ssim_cv2(cv2.pyrDown(cv2.pyrDown(run_image)),
+                          cv2.pyrDown(cv2.pyrDown(ref_image)))
+    if 0.7 <= ssim_value <= 0.98:
+        ssim_value = ssim_cv2(run_image, ref_image)
 
     return Metrics(total_pixels, diff_pixels, mse, ssim_value)
 
 
-def GenerateReport(root : QtGui.QStandardItem, limit: int = 0) -> list[ReportEntry]:
-    report = []
+# SSIM stabilization constants for 8-bit images (Wang et al.)
+_SSIM_C1 = (0.01 * 255) ** 2
+_SSIM_C2 = (0.03 * 255) ** 2
+
+# OpenCV's transparent OpenCL path: wrapping the inputs in UMat runs the
+# blur-heavy SSIM pipeline on the GPU when a device is present, with
+# automatic CPU fallback otherwise
+_HAVE_OPENCL = bool(cv2.ocl.haveOpenCL())
+
+
+def ssim_cv2(run_image, ref_image) -> float:
+    """Mean SSIM of two grayscale uint8 images.
+
+    Same Gaussian-window formulation as skimage's structural_similarity
+    with gaussian_weights=True, but built on OpenCV primitives (separable
+    SIMD GaussianBlur, fused addWeighted), so the identical pipeline runs
+    on plain Mats or, via UMat, on an OpenCL device.
+    """
+    a = run_image.astype(np.float32)
+    b = ref_image.astype(np.float32)
+    if _HAVE_OPENCL:
+        a = cv2.UMat(a)
+        b = cv2.UMat(b)
+    mu_a = cv2.GaussianBlur(a, (11, 11), 1.5)
+    mu_b = cv2.GaussianBlur(b, (11, 11), 1.5)
+    mu_aa = cv2.multiply(mu_a, mu_a)
+    mu_bb = cv2.multiply(mu_b, mu_b)
+    mu_ab = cv2.multiply(mu_a, mu_b)
+    sigma_aa = cv2.subtract(cv2.GaussianBlur(cv2.multiply(a, a), (11, 11), 1.5), mu_aa)
+    sigma_bb = cv2.subtract(cv2.GaussianBlur(cv2.multiply(b, b), (11, 11), 1.5), mu_bb)
+    sigma_ab = cv2.subtract(cv2.GaussianBlur(cv2.multiply(a, b), (11, 11), 1.5), mu_ab)
+    # (2*mu_ab + C1)(2*sigma_ab + C2) / ((mu_aa + mu_bb + C1)(sigma_aa + sigma_bb + C2))
+    numerator = cv2.multiply(cv2.addWeighted(mu_ab, 2, mu_ab, 0, _SSIM_C1),
+                             cv2.addWeighted(sigma_ab, 2, sigma_ab, 0, _SSIM_C2))
+    denominator = cv2.multiply(cv2.addWeighted(mu_aa, 1, mu_bb, 1, _SSIM_C1),
+                               cv2.addWeighted(sigma_aa, 1, sigma_bb, 1, _SSIM_C2))
+    return float(cv2.mean(cv2.divide(numerator, denominator))[0])
+
+
+@functools.lru_cache(maxsize=256)
+def _load_gray(path: str):
+    # the same reference image is typically scored against many run frames
+    # during a report; cache the decode (per process when pooled). Decoding
+    # from a memory map keeps the file bytes in the OS page cache, shared
+    # with the Qt image readers that display the same files.
+    try:
+        with open(path, 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return cv2.imdecode(np.frombuffer(mapped, np.uint8), cv2.IMREAD_GRAYSCALE)
+    except (OSError, ValueError):
+        return None
+
+
+def _init_metrics_worker():
+    # one OpenCV thread per pool worker, otherwise every worker spawns its
+    # own internal pool and they trample each other
+    cv2.setNumThreads(1)
+
+
+def GenerateReport(root : QtGui.QStandardItem, test_results: list[TestResult], limit: int = 0) -> pd.DataFrame:
     if limit == 0:
         limit = root.rowCount()
-    
+
+    # walk the tree on the calling thread (QStandardItem isn't picklable)
+    # and collect the jobs as one flat list per field: the scoring and
+    # column-building passes below then index parallel arrays instead of
+    # reaching through per-element Python objects
+    directories, tests, elements_col = [], [], []
+    run_files, ref_files, pre_counts, statuses = [], [], [], []
     for row in range(limit):
         child = root.child(row)
         item_type = child.data(TreeUserRole.Type.value)
         dir = child.data(TreeUserRole.Data.value)
-        
+
         if item_type == TreeItemType.Directory.value:
-            print(f"There are {child.rowCount()}")
-            for row in range(child.rowCount()):
-                test_result = child.child(row)
+            for test_row in range(child.rowCount()):
+                test_result = child.child(test_row)
                 test_item_type = test_result.data(TreeUserRole.Type.value)
-                test_data = test_result.data(TreeUserRole.Data.value)
                 if test_item_type == TreeItemType.TestResult.value:
+                    test_data = test_results[test_result.data(TreeUserRole.Data.value)]
+                    test_name = test_result.text()
                     for name, elements in test_data.diff.items():
                         for element in elements:
-                            metrics = ComputeMetrics(element.run_file, element.ref_file)
-                            if metrics:
-                                report_entry = ReportEntry(
-                                    directory=dir,
-                                    test=test_result.text(),
-                                    element=name,
-                                    mse=metrics.mse,
-                                    SSIM=metrics.ssim,
-                                    diff_percentage=(metrics.diff_pixels_count / metrics.total_pixels_count) * 100,
-                                    diff_count=metrics.diff_pixels_count,
-                                    diff_count_pre_computed=int(element.delta_count),
-                                    pixel_count=metrics.total_pixels_count,
-                                    problem_level=ProblemLevel.GOOD if metrics.ssim > 0.95 else ProblemLevel.SOFT,
-                                    level=int((metrics.diff_pixels_count / metrics.total_pixels_count) * 20),
-                                    message=element.status
-                                )
-                                report.append(report_entry)
-                            else:
-                                report_entry = ReportEntry(
-                                    directory=dir,
-                                    test=test_result.text(),
-                                    element=name,
-                                    mse=0,
-                                    SSIM=0,
-                                    diff_percentage=0,
-                                    diff_count=0,
-                                    diff_count_pre_computed=int(element.delta_count),
-                                    pixel_count=0,
-                                    problem_level=ProblemLevel.HARD,
-                                    level=20,
-                                    message="Rendering failed"
-                                )
-                                report.append(report_entry)
-
-                
-            
-    
-    return report
+                            directories.append(dir)
+                            tests.append(test_name)
+                            elements_col.append(name)
+                            run_files.append(element.run_file)
+                            ref_files.append(element.ref_file)
+                            pre_counts.append(int(element.delta_count))
+                            statuses.append(element.status)
+
+    # pre-scan with one directory listing per referenced folder instead of
+    # two stat calls per pair: failed runs leave many files missing, and
+    # those pairs go straight to the failed-entry path without ever being
+    # dispatched to a worker
+    dir_entries: dict[str, set] = {}
+
+    def _pair_exists(run_file: str, ref_file: str) -> bool:
+        for path in (run_file, ref_file):
+            parent = os.path.dirname(path)
+            entries = dir_entries.get(parent)
+            if entries is None:
+                try:
+                    entries = set(os.listdir(parent))
+                except OSError:
+                    entries = set()
+                dir_entries[parent] = entries
+            if os.path.basename(path) not in entries:
+                return False
+        return True
+
+    scored = [index for index in range(len(run_files))
+              if _pair_exists(run_files[index], ref_files[index])]
+
+    print(f"Computing metrics for {len(scored)} of {len(run_files)} render elements")
+    all_metrics = [None] * len(run_files)
+    if len(scored) > 32:
+        # decode + metric per pair is CPU-bound and independent, so score
+        # the pairs across all cores
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_metrics_worker) as executor:
+            for index, metrics in zip(scored,
+                                      executor.map(ComputeMetrics,
+                                                   [run_files[index] for index in scored],
+                                                   [ref_files[index] for index in scored],
+                                                   chunksize=8)):
+                all_metrics[index] = metrics
+    else:
+        # pipeline the small runs instead: while pair N is scored on this
+        # thread, a prefetcher warms the image cache for pair N+1, so decode
+        # I/O overlaps with the compute-bound SSIM
+        with ThreadPoolExecutor(max_workers=2) as prefetcher:
+            for position, index in enumerate(scored):
+                if position + 1 < len(scored):
+                    next_index = scored[position + 1]
+                    prefetcher.submit(_load_gray, run_files[next_index])
+                    prefetcher.submit(_load_gray, ref_files[next_index])
+                all_metrics[index] = ComputeMetrics(run_files[index], ref_files[index])
+        # free the decoded images once the serial run is done (pool workers
+        # take their caches with them)
+        _load_gray.cache_clear()
+
+    # the derived columns are vectorized below instead of computed per entry
+    mses, ssims, diff_counts, pixel_counts = [], [], [], []
+    messages, failed = [], []
+    for status, metrics in zip(statuses, all_metrics):
+        if metrics:
+            mses.append(metrics.mse)
+            ssims.append(metrics.ssim)
+            diff_counts.append(metrics.diff_pixels_count)
+            pixel_counts.append(metrics.total_pixels_count)
+            messages.append(status)
+            failed.append(False)
+        else:
+            mses.append(0.0)
+            ssims.append(0.0)
+            diff_counts.append(0)
+            pixel_counts.append(0)
+            messages.append("Rendering failed")
+            failed.append(True)
+
+    ssims = np.asarray(ssims)
+    diff_counts = np.asarray(diff_counts, dtype=np.int64)
+    pixel_counts = np.asarray(pixel_counts, dtype=np.int64)
+    failed = np.asarray(failed, dtype=bool)
+    diff_percentage = diff_counts / np.where(pixel_counts > 0, pixel_counts, 1) * 100
+    level = (diff_percentage * 0.2).astype(np.int64)
+    level[failed] = 20
+    problem_level = np.where(failed, ProblemLevel.HARD,
+                             np.where(ssims > 0.95, ProblemLevel.GOOD, ProblemLevel.SOFT))
+
+    return pd.DataFrame({
+        "directory": directories,
+        "test": tests,
+        "element": elements_col,
+        "mse": mses,
+        "SSIM": ssims,
+        "diff_percentage": diff_percentage,
+        "diff_count_pre_computed": pre_counts,
+        "diff_count": diff_counts,
+        "pixel_count": pixel_counts,
+        "problem_level": problem_level,
+        "level": level,
+        "message": messages,
+    })
 
 
 
@@ -318,6 +636,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.ui.setupUi(self)
         self.setWindowTitle("VRay Results Viewer")
         self.ui.treeView_results.installEventFilter(self)
+        # all rows are plain one-line items; telling the view so turns the
+        # row-height lookup into O(1)
+        self.ui.treeView_results.setUniformRowHeights(True)
         self.setAcceptDrops(True)
 
         # Set size policies for labels to allow them to shrink
@@ -328,15 +649,52 @@ class MainWindow(QtWidgets.QMainWindow):
         
         self.current_frame = 0
         self.current_render_elements = None
+        # (files, label sizes) of the last displayed images,
+        # used to skip redundant reloads on spurious slider/resize events
+        self._last_load_key = None
+        # source model currently attached to the tree view (built off-thread
+        # by TreeModelBuildRunnable, so the window keeps the only reference)
+        self._tree_model = None
+
+        # 256 MB of cached scaled pixmaps (limit is in KB)
+        QtGui.QPixmapCache.setCacheLimit(256 * 1024)
+
+        # decoded images come back from the worker pool through this signal
+        # and get converted + cached on the GUI thread; the request id lets
+        # results from a superseded frame be dropped on arrival
+        self._load_request_id = 0
+        self._image_load_signals = ImageLoadSignals()
+        self._image_load_signals.loaded.connect(self.on_image_loaded)
+
+        # coalesce the burst of resize events during a window drag into a
+        # single rescale once the user stops resizing
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(75)
+        self._resize_timer.timeout.connect(self.load_image)
 
         # for filtering the tree view
         self.proxy_model = QtCore.QSortFilterProxyModel(self)
         self.proxy_model.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
-        self.ui.lineEdit_searchBar.textChanged.connect(self.proxy_model.setFilterFixedString)
+        self.proxy_model.setRecursiveFilteringEnabled(True)
+        # re-filtering the whole tree per keystroke is expensive; apply the
+        # filter only after a short pause in typing
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.apply_tree_filter)
+        self.ui.lineEdit_searchBar.textChanged.connect(lambda _: self._filter_timer.start())
     
+        # persistent stats models, updated in place on each selection/frame
+        # change instead of rebuilding one per tick
+        self._render_element_model = QtGui.QStandardItemModel(self)
+        self._test_result_model = QtGui.QStandardItemModel(self)
+        self._current_stats_model = None
+
         self.cwd = Path.cwd()
         # not actually required, but for clarity
         self.results_json = None
+        self._results_hash = None
         self.test_header = TestHeader()
         self.test_results = list[TestResult]
         self.report = None
@@ -404,6 +762,14 @@ class MainWindow(QtWidgets.QMainWindow):
 
 
     
+    def apply_tree_filter(self):
+        text = self.ui.lineEdit_searchBar.text()
+        # a single character matches nearly everything and is never a useful
+        # filter; wait for at least two (empty text clears the filter)
+        if len(text) == 1:
+            return
+        self.proxy_model.setFilterFixedString(text)
+
     def swap_run_with_ref_pixmap(self):
         # swap the run and ref pixmaps
         run_pixmap = self.ui.label_resultImage.pixmap()
@@ -427,7 +793,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def resizeEvent(self, event: QtCore.QEvent):
         if hasattr(self, "current_render_elements") and self.current_render_elements:
-            self.load_image()
+            self._resize_timer.start()
         super().resizeEvent(event)
     
     def on_slider_valueChanged(self, value: int):
@@ -442,21 +808,101 @@ class MainWindow(QtWidgets.QMainWindow):
     
     def load_image(self):
         render_element = self.current_render_elements[self.current_frame]
-        self.ui.label_resultImage.setPixmap(create_pixmap_scaled(render_element.run_file, self.ui.label_resultImage.size()))
-        self.ui.label_referenceImage.setPixmap(create_pixmap_scaled(render_element.ref_file, self.ui.label_referenceImage.size()))
-        self.ui.label_diffImage.setPixmap(create_pixmap_scaled(render_element.delta_file, self.ui.label_diffImage.size()))
+        # keyed on the actual files: consecutive frames (or another element
+        # with identical outputs) that reference the same images skip the
+        # reload entirely
+        key = (render_element.run_file, render_element.ref_file, render_element.delta_file,
+               self.ui.label_resultImage.size().toTuple(),
+               self.ui.label_referenceImage.size().toTuple(),
+               self.ui.label_diffImage.size().toTuple())
+        if key == self._last_load_key:
+            return
+        # cache hits are applied immediately; misses are decoded on the
+        # worker pool so slider dragging never blocks on image decode
+        self._load_request_id += 1
+        pool = QtCore.QThreadPool.globalInstance()
+        probe = QtGui.QPixmap()
+        for label_name, file in (("label_resultImage", render_element.run_file),
+                                 ("label_referenceImage", render_element.ref_file),
+                                 ("label_diffImage", render_element.delta_file)):
+            label = getattr(self.ui, label_name)
+            if not file:
+                label.clear()
+                continue
+            cache_key = pixmap_cache_key(file, label.size())
+            if QtGui.QPixmapCache.find(cache_key, probe):
+                label.setPixmap(probe)
+            else:
+                pool.start(ImageLoadRunnable(file, label.size(), cache_key,
+                                             self._image_load_signals, self._load_request_id, label_name))
+        self._last_load_key = key
+        self.preload_neighbor_frames()
+
+    def on_image_loaded(self, request_id: int, label_name: str, key: str, image: QtGui.QImage):
+        if image.isNull():
+            # the decode failed (missing or corrupt file): blank the target
+            # so the previous frame's image is not shown for this one
+            if label_name and request_id == self._load_request_id:
+                getattr(self.ui, label_name).setPixmap(QtGui.QPixmap())
+            return
+        pixmap = QtGui.QPixmap.fromImage(image)
+        probe = QtGui.QPixmap()
+        if not QtGui.QPixmapCache.find(key, probe):
+            QtGui.QPixmapCache.insert(key, pixmap)
+        # only the newest request may touch the labels; stale decodes just warm the cache
+        if label_name and request_id == self._load_request_id:
+            getattr(self.ui, label_name).setPixmap(pixmap)
+
+    def preload_neighbor_frames(self):
+        """Warm the pixmap cache for the frames around the current one so
+        stepping the slider hits RAM instead of cold disk reads."""
+        elements = self.current_render_elements
+        if not elements:
+            return
+        labels = ((self.ui.label_resultImage, "run_file"),
+                  (self.ui.label_referenceImage, "ref_file"),
+                  (self.ui.label_diffImage, "delta_file"))
+        pool = QtCore.QThreadPool.globalInstance()
+        probe = QtGui.QPixmap()
+        for offset in (-2, -1, 1, 2):
+            frame = self.current_frame + offset
+            if frame < 0 or frame >= len(elements):
+                continue
+            element = elements[frame]
+            for label, attr in labels:
+                file = getattr(element, attr)
+                if not file:
+                    continue
+                size = label.size()
+                key = pixmap_cache_key(file, size)
+                if QtGui.QPixmapCache.find(key, probe):
+                    continue
+                pool.start(ImageLoadRunnable(file, size, key, self._image_load_signals))
     
+    def show_stats_model(self, model):
+        # reattaching the same model makes the view relayout for nothing
+        if model is not self._current_stats_model:
+            set_table_model(self.ui.tableView_stats, model)
+            self._current_stats_model = model
+
     def load_render_elements_info(self):
         redner_element = self.current_render_elements[self.current_frame]
-        model = create_render_elements_table_model(redner_element)
-        set_table_model(self.ui.tableView_stats, model)
-  
-    def handle_stats_display(self, data: TestResult | RenderElement):
+        model = create_render_elements_table_model(redner_element, self._render_element_model)
+        self.show_stats_model(model)
+
+    def handle_stats_display(self, data: TestResult | RenderElement | list):
         if isinstance(data, TestResult):
-            model = create_test_result_teable_model(data)
+            model = create_test_result_teable_model(data, self._test_result_model)
+        elif isinstance(data, RenderElement):
+            model = create_render_elements_table_model(data, self._render_element_model)
         elif isinstance(data, list):
-            model = create_render_elements_table_model(data[self.current_frame])
-        set_table_model(self.ui.tableView_stats, model)
+            model = create_render_elements_table_model(data[self.current_frame], self._render_element_model)
+        else:
+            # an unhandled payload used to fall through to an unbound `model`
+            # and raise NameError; leave the current stats untouched instead
+            print(f"Unhandled stats payload: {type(data).__name__}")
+            return
+        self.show_stats_model(model)
 
     def handle_image_display(self, render_elements: list[RenderElement]):
         self.current_render_elements = render_elements
@@ -471,12 +917,13 @@ class MainWindow(QtWidgets.QMainWindow):
                 return
             type = item.data(TreeUserRole.Type.value)
             if type == TreeItemType.RenderElement.value:
-                render_elements = item.data(TreeUserRole.Data.value)
+                test_index, name = item.data(TreeUserRole.Data.value)
+                render_elements = self.test_results[test_index].diff.get(name, [])
                 self.adjust_status_bar(0, len(render_elements)-1, 1, self.current_frame)
                 self.handle_image_display(render_elements)
                 self.handle_stats_display(render_elements)
             elif type == TreeItemType.TestResult.value:
-                test_result = item.data(TreeUserRole.Data.value)
+                test_result = self.test_results[item.data(TreeUserRole.Data.value)]
                 self.adjust_status_bar(0, len(test_result.diff)-1, 1, self.current_frame)
                 self.handle_stats_display(test_result)
 
@@ -490,7 +937,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.current_frame = 0
 
         if type == TreeItemType.TestResult.value:
-            test_result = item.data(TreeUserRole.Data.value)
+            test_result = self.test_results[item.data(TreeUserRole.Data.value)]
             # key = next(iter(test_result.diff.keys()))
             # print(f"Displaying: {key}")
             # render_elements = test_result.diff[key]
@@ -499,7 +946,8 @@ class MainWindow(QtWidgets.QMainWindow):
             #     self.handle_image_display(render_elements)
             self.handle_stats_display(test_result)
         elif type == TreeItemType.RenderElement.value:
-            render_elements = item.data(TreeUserRole.Data.value)
+            test_index, name = item.data(TreeUserRole.Data.value)
+            render_elements = self.test_results[test_index].diff.get(name, [])
             self.adjust_status_bar(0, len(render_elements)-1, 1, self.current_frame)
             self.handle_image_display(render_elements)
             self.handle_stats_display(render_elements)
@@ -509,10 +957,31 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def load_json_results(self, json_results_file):
         print(f"Loading results from {json_results_file}")
-        with open(json_results_file, 'r') as file:
-            self.results_json = json.load(file)
+        # memory-map the file so orjson scans the bytes in place instead of
+        # going through an extra full-file copy (orjson takes a memoryview
+        # but rejects the mmap object itself; the stdlib fallback still
+        # needs real bytes)
+        with open(json_results_file, 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # identifies this result set for the on-disk report cache
+                self._results_hash = hashlib.sha1(mapped).hexdigest()
+                if orjson is not None:
+                    self.results_json = orjson.loads(memoryview(mapped))
+                else:
+                    self.results_json = json.loads(mapped[:])
         self.test_header = load_test_header(self.results_json)
-        self.test_results = [load_test_result(test) for test in self.results_json.get("tests", [])]
+        # pop the tests array and convert it in place so each raw sub-dict can be
+        # collected as soon as its dataclass exists, instead of keeping the whole
+        # parsed JSON alive next to the converted model
+        tests = self.results_json.pop("tests", [])
+        self.results_json = None
+        if len(tests) > 256:
+            # the per-test conversion is pure Python and independent per test,
+            # so fan it out across cores; small files aren't worth the pool spawn
+            with ProcessPoolExecutor() as executor:
+                self.test_results = list(executor.map(load_test_result, tests, chunksize=64))
+        else:
+            self.test_results = [load_test_result(test) for test in tests]
         print(f"Loaded {len(self.test_results)} test results")
 
     def load(self, default_folder: Path=None):
@@ -529,52 +998,28 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def populate_tree_view(self):
         print("Populating tree view")
-       
-        model = QtGui.QStandardItemModel()
-        model.setHorizontalHeaderLabels(["Results"])
-
-        directory_items = {}
-
-        for test_result in self.test_results:
-            # Create a new item for each test result
-            directory = test_result.file_path.parent
-            if directory not in directory_items:
-                directory_item = QtGui.QStandardItem(str(directory))
-                directory_items[directory] = directory_item
-                directory_item.setData(TreeItemType.Directory.value, TreeUserRole.Type.value)
-                directory_item.setData(directory, TreeUserRole.Data.value)
-                model.appendRow(directory_item)
-            else:
-                directory_item = directory_items[directory]
-        
-            test_item = QtGui.QStandardItem(test_result.file_name)
-            test_item.setToolTip(f"Status: {test_result.status}\nMetric: {test_result.metric}\nExit Code: {test_result.exit_code}")
-            test_item.setData(TreeItemType.TestResult.value, TreeUserRole.Type.value)
-            test_item.setData(test_result, TreeUserRole.Data.value)
-            # check the test_result exit code if it is not 0, set the background color to red
-            if test_result.exit_code != 0:
-                test_item.setBackground(QtGui.QBrush(QtGui.QColor(255, 0, 0, 100)))
-
-            # check the test_result diff for the render elements
-            for name, elements  in test_result.diff.items():
-                n_frames = len(elements)
-                item_name = name if n_frames == 1 else f"{name} (x{n_frames})"
-                render_element = elements[0]
-                render_element_item = QtGui.QStandardItem(item_name)
-                render_element_item.setToolTip(f"Delta Count: {render_element.delta_count}\nStatus: {render_element.status}")
-                render_element_item.setData(TreeItemType.RenderElement.value, TreeUserRole.Type.value)
-                render_element_item.setData(elements, TreeUserRole.Data.value)
-                if render_element.exit_code != 0:
-                    render_element_item.setBackground(QtGui.QBrush(QtGui.QColor(255, 165, 0, 100)))
-                else:
-                    render_element_item.setBackground(QtGui.QBrush(QtGui.QColor(0, 255, 0, 100)))
-                test_item.appendRow(render_element_item)
-                    
-            directory_item.appendRow(test_item)
-        
+        # the model is assembled on the worker pool so the window stays
+        # responsive while thousands of items are created; only the cheap
+        # attach happens back on the GUI thread
+        self._tree_build_signals = TreeModelBuildSignals()
+        self._tree_build_signals.finished.connect(self.attach_tree_model)
+        QtCore.QThreadPool.globalInstance().start(
+            TreeModelBuildRunnable(self.test_results, self._tree_build_signals))
+
+    def attach_tree_model(self, model: QtGui.QStandardItemModel):
+        # the model arrives parentless from the worker; keep it referenced so
+        # it outlives the slot
+        self._tree_model = model
+        # defer painting and sorting until the whole tree is attached and expanded,
+        # otherwise every expanded row triggers its own relayout
+        self.ui.treeView_results.setUpdatesEnabled(False)
+        self.ui.treeView_results.setSortingEnabled(False)
         self.proxy_model.setSourceModel(model)
         self.ui.treeView_results.setModel(self.proxy_model)
-        self.ui.treeView_results.expandAll()
+        # expanding everything forces Qt to instantiate an index per row;
+        # open just the directory level and let the user drill down
+        self.ui.treeView_results.expandToDepth(0)
+        self.ui.treeView_results.setUpdatesEnabled(True)
         self.ui.treeView_results.selectionModel().selectionChanged.connect(self.on_tree_selection_changed)
 
     def generate_report(self):
@@ -582,15 +1027,22 @@ class MainWindow(QtWidgets.QMainWindow):
             print("Report already generated")
             return
         
-        model = self.proxy_model.sourceModel()
-        root_item = model.invisibleRootItem()
-        self._report = GenerateReport(root_item, limit=0)
-
-        # convert to pandas dataframe
-      
-        self.report_df = pd.DataFrame([entry.__dict__ for entry in self._report])
-        # remove the rows with the directory == "emulation"
-        self.report_df = self.report_df[self.report_df["directory"] != "emulation"]
+        # reports are expensive (every image pair gets decoded and scored),
+        # so cache the dataframe on disk keyed by the results.json contents
+        cache_file = self.cwd / f"report-{self._results_hash}.pkl" if self._results_hash else None
+        if cache_file is not None and cache_file.is_file():
+            print(f"Loading cached report from {cache_file}")
+            self.report_df = pd.read_pickle(cache_file)
+        else:
+            model = self.proxy_model.sourceModel()
+            root_item = model.invisibleRootItem()
+            self.report_df = GenerateReport(root_item, self.test_results, limit=0)
+            # remove the rows with the directory == "emulation"
+            self.report_df = self.report_df[self.report_df["directory"] != "emulation"]
+
+            if cache_file is not None:
+                self.report_df.to_pickle(cache_file)
+                print(f"Cached report to {cache_file}")
 
         total_entries = len(self.report_df)
         print(f"Total entries: {total_entries}")
@@ -645,6 +1097,7 @@ class MainWindow(QtWidgets.QMainWindow):
         
         # Reset data models
         self.results_json = None
+        self._results_hash = None
         self.test_header = TestHeader()
         self.test_results = []
         self.report = None
@@ -653,6 +1106,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # Clear current render elements
         self.current_render_elements = None
         self.current_frame = 0
+        self._last_load_key = None
         
         # Reset the UI elements
         self.ui.label_resultImage.clear()
@@ -662,13 +1116,17 @@ class MainWindow(QtWidgets.QMainWindow):
         # Clear the tree view
         model = QtGui.QStandardItemModel()
         model.setHorizontalHeaderLabels(["Results"])
+        self._tree_model = model
         self.proxy_model.setSourceModel(model)
         self.ui.treeView_results.setModel(self.proxy_model)
         
         # Clear the stats table
+        self._render_element_model.clear()
+        self._test_result_model.clear()
         empty_model = QtGui.QStandardItemModel()
         empty_model.setHorizontalHeaderLabels(["Field", "Value"])
         set_table_model(self.ui.tableView_stats, empty_model)
+        self._current_stats_model = empty_model
         
         # Reset the status bar and slider
         self.adjust_status_bar(0, 0, 1, 0)